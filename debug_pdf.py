@@ -2,7 +2,8 @@ import pdfplumber
 
 with pdfplumber.open('housea.pdf') as pdf:
     first_page = pdf.pages[0]
-    text = first_page.extract_text()
+    # Same call as extract_players_from_pdf, so the line numbers match what it parses
+    text = first_page.extract_text_simple()
 
     lines = text.split('\n')
 
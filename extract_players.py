@@ -2,29 +2,142 @@ import pdfplumber
 import csv
 import re
 import os
+import pickle
 import urllib.request
+import urllib.error
 import glob
+import hashlib
+import signal
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from operator import attrgetter
+
+try:
+    from rapidfuzz import fuzz, process  # optional fuzzy fallback for unmatched names
+except ImportError:
+    fuzz = process = None
+
+# One word of a name: a capital followed by lowercase letters, apostrophes or hyphens (McCaffrey, O'Brien,
+# To'oTo'o, Pran-Granger). All-caps tokens such as the next entry's position never match.
+NAME_WORD_PATTERN = r"[A-Z](?:[a-z]+(?:[A-Z][a-z]+)*|['-][A-Za-z]+)(?:['-][A-Za-z]+)*"
+
+# Pattern: POS NUM NAME (handles Jo.Phillips, McCaffrey, O'Brien, To'oTo'o, Van Pran-Granger, etc.)
+PLAYER_RE = re.compile(r"([A-Z/]+)\s+(\d+)\s+([A-Z][a-z]*\." + NAME_WORD_PATTERN + r"(?:\s+" + NAME_WORD_PATTERN + r")*)")
+
+# Start of a POS NUM I.Name entry, used to find where the second column begins
+COLUMN_START_RE = re.compile(r"(?<![A-Z/])[A-Z/]+\s+\d+\s+[A-Z][a-z]*\.")
+
+# Fallback name matching only compares names within this many characters of each other
+MAX_NAME_LENGTH_DIFF = 2
+
+# Minimum rapidfuzz WRatio score accepted by the fuzzy fallback
+FUZZY_SCORE_CUTOFF = 85
+
+# Columns of the nflverse players CSV that matching cannot work without
+REQUIRED_DB_COLUMNS = ('gsis_id', 'latest_team')
+
+# Bump when the structure of the lookup dictionaries changes to invalidate cached copies
+DATABASE_CACHE_VERSION = 1
+
+# Page one lines that carry a header field or start a section, found with one search per line
+PAGE_MARKER_RE = re.compile(r"^(?:Date:|VISITOR:|HOME:)|^\s*Lineups\s*$|Substitutions|Did Not Play|Not Active")
+
+# Section header -> key of its line index in scan_first_page's result
+SECTION_INDEX_KEYS = {
+    'Substitutions': 'substitutions_idx',
+    'Did Not Play': 'did_not_play_idx',
+    'Not Active': 'not_active_idx'
+}
+
+# Read size used when streaming the players database download
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Seconds allowed for parsing the first page of a PDF before giving up on it
+PAGE_TIMEOUT = 60
+
+# Player status -> single-character code used in the SQL output
+STATUS_CODE = {
+    'starter': 'S',
+    'backup': 'B',
+    'inactive': 'I',
+    'did_not_play': 'B'
+}
+
+# Standard GSIS ID (00-XXXXXXX) or the old format of three letters and digits (RIV553722)
+VALID_GSIS_RE = re.compile(r"00-|[A-Za-z]{3}\d{5,}\Z")
+
+# Player attributes written by save_to_csv, in column order
+CSV_FIELDS = ('gsis_id', 'team', 'name', 'position', 'status')
+
+# Full team name -> abbreviation used by the nflverse database
+TEAM_ABBR = {
+    'Houston Texans': 'HOU',
+    'Seattle Seahawks': 'SEA',
+    'Arizona Cardinals': 'ARI',
+    'Atlanta Falcons': 'ATL',
+    'Baltimore Ravens': 'BAL',
+    'Buffalo Bills': 'BUF',
+    'Carolina Panthers': 'CAR',
+    'Chicago Bears': 'CHI',
+    'Cincinnati Bengals': 'CIN',
+    'Cleveland Browns': 'CLE',
+    'Dallas Cowboys': 'DAL',
+    'Denver Broncos': 'DEN',
+    'Detroit Lions': 'DET',
+    'Green Bay Packers': 'GB',
+    'Indianapolis Colts': 'IND',
+    'Jacksonville Jaguars': 'JAX',
+    'Kansas City Chiefs': 'KC',
+    'Las Vegas Raiders': 'LV',
+    'Los Angeles Chargers': 'LAC',
+    'Los Angeles Rams': 'LAR',
+    'Miami Dolphins': 'MIA',
+    'Minnesota Vikings': 'MIN',
+    'New England Patriots': 'NE',
+    'New Orleans Saints': 'NO',
+    'New York Giants': 'NYG',
+    'New York Jets': 'NYJ',
+    'Philadelphia Eagles': 'PHI',
+    'Pittsburgh Steelers': 'PIT',
+    'San Francisco 49ers': 'SF',
+    'Tampa Bay Buccaneers': 'TB',
+    'Tennessee Titans': 'TEN',
+    'Washington Commanders': 'WAS'
+}
+
+class Player:
+    """A player listed in a gamebook, plus the result of matching them to the database.
+
+    Uses __slots__ instead of a per-player dict: a season's batch creates tens
+    of thousands of these, and slot access is cheaper than a dict lookup.
+    """
+    __slots__ = ('team', 'name', 'position', 'status', 'gsis_id', 'match_strategy')
+
+    def __init__(self, team, name, position, status, gsis_id='', match_strategy=None):
+        self.team = team
+        self.name = name
+        self.position = position
+        self.status = status
+        self.gsis_id = gsis_id
+        self.match_strategy = match_strategy
+
+    def __repr__(self):
+        return f"Player({self.team!r}, {self.name!r}, {self.position!r}, {self.status!r}, gsis_id={self.gsis_id!r})"
 
 def parse_lineup_line(line, visitor_team, home_team):
     """Parse a single lineup line into players for both teams."""
     players = []
 
     # Each line has 4 sections: Team1 Offense, Team1 Defense, Team2 Offense, Team2 Defense
-    # Pattern: POS NUM NAME (handles Jo.Phillips, McCaffrey, O'Brien, To'oTo'o, Van Pran-Granger, etc.)
-    pattern = r"([A-Z/]+)\s+(\d+)\s+([A-Z][a-z]*\.[A-Z](?:[a-z]+(?:[A-Z][a-z]+)*|[\'-][A-Za-z]+)(?:[\'-][A-Za-z]+)*(?:\s+[A-Z](?:[a-z]+(?:[A-Z][a-z]+)*|[\'-][A-Za-z]+)(?:[\'-][A-Za-z]+)*)*)"
-
-    matches = re.findall(pattern, line)
-
     # There should be 4 matches per line (one for each column)
     # Columns 0 and 1 are visitor team, columns 2 and 3 are home team
-    for idx, (position, number, name) in enumerate(matches):
+    for idx, m in enumerate(PLAYER_RE.finditer(line)):
         team = visitor_team if idx < 2 else home_team
-        players.append({
-            'team': team,
-            'name': name,
-            'position': position,
-            'status': 'starter'
-        })
+        # Position is interned so the few distinct values are shared by all players
+        players.append(Player(team, m.group(3), sys.intern(m.group(1)), 'starter'))
 
     return players
 
@@ -36,108 +149,207 @@ def parse_two_column_line(line, visitor_team, home_team):
     # Most lines are around 100-120 characters, so split around 55-60
     midpoint = len(line) // 2
 
-    # Find a good split point near the midpoint (look for a comma or space)
+    # Split where the first POS NUM entry near the midpoint starts, so an entry is never cut in half
     best_split = midpoint
-    for i in range(midpoint - 10, midpoint + 10):
-        if i < len(line) and (line[i] == ',' or (line[i:i+3].strip() and line[i-1:i] == ' ' and line[i].isupper())):
-            best_split = i
-            break
+    m = COLUMN_START_RE.search(line, max(0, midpoint - 10))
+    if m and m.start() < midpoint + 10:
+        best_split = m.start()
 
     left_half = line[:best_split]
     right_half = line[best_split:]
 
-    # Pattern: POS NUM NAME (handles Jo.Phillips, McCaffrey, O'Brien, To'oTo'o, Van Pran-Granger, etc.)
-    pattern = r"([A-Z/]+)\s+(\d+)\s+([A-Z][a-z]*\.[A-Z](?:[a-z]+(?:[A-Z][a-z]+)*|[\'-][A-Za-z]+)(?:[\'-][A-Za-z]+)*(?:\s+[A-Z](?:[a-z]+(?:[A-Z][a-z]+)*|[\'-][A-Za-z]+)(?:[\'-][A-Za-z]+)*)*)"
-
     # Parse left half (visitor team)
-    matches_left = re.findall(pattern, left_half)
-    for position, number, name in matches_left:
-        players.append({
-            'team': visitor_team,
-            'name': name,
-            'position': position,
-            'status': 'backup'
-        })
+    for m in PLAYER_RE.finditer(left_half):
+        players.append(Player(visitor_team, m.group(3), sys.intern(m.group(1)), 'backup'))
 
     # Parse right half (home team)
-    matches_right = re.findall(pattern, right_half)
-    for position, number, name in matches_right:
-        players.append({
-            'team': home_team,
-            'name': name,
-            'position': position,
-            'status': 'backup'
-        })
+    for m in PLAYER_RE.finditer(right_half):
+        players.append(Player(home_team, m.group(3), sys.intern(m.group(1)), 'backup'))
 
     return players
 
 def parse_player_list(text, team_name, status):
     """Parse a comma-separated or space-separated list of players."""
     players = []
+    append = players.append
 
-    # Pattern: POS NUM NAME (handles Jo.Phillips, McCaffrey, O'Brien, To'oTo'o, Van Pran-Granger, etc.)
-    pattern = r"([A-Z/]+)\s+(\d+)\s+([A-Z][a-z]*\.[A-Z](?:[a-z]+(?:[A-Z][a-z]+)*|[\'-][A-Za-z]+)(?:[\'-][A-Za-z]+)*(?:\s+[A-Z](?:[a-z]+(?:[A-Z][a-z]+)*|[\'-][A-Za-z]+)(?:[\'-][A-Za-z]+)*)*)"
-
-    matches = re.findall(pattern, text)
-
-    for position, number, name in matches:
-        players.append({
-            'team': team_name,
-            'name': name,
-            'position': position,
-            'status': status
-        })
+    for m in PLAYER_RE.finditer(text):
+        append(Player(team_name, m.group(3), sys.intern(m.group(1)), status))
 
     return players
 
-def download_players_database(output_path='players.csv'):
-    """Download the nflverse players database if it doesn't exist."""
-    if os.path.exists(output_path):
+def _file_sha256(path):
+    """Return the hex SHA-256 digest of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def download_players_database(output_path='players.csv', refresh=False):
+    """Download the nflverse players database if it doesn't exist.
+
+    With refresh=True an existing copy is revalidated against the server using
+    the ETag saved from the previous download, and is only re-downloaded if it
+    has changed. The ETag is only trusted while the local file still matches the
+    SHA-256 digest recorded when it was downloaded.
+    """
+    exists = os.path.exists(output_path)
+    if exists and not refresh:
         print(f"Players database already exists at {output_path}")
         return output_path
 
     url = 'https://github.com/nflverse/nflverse-data/releases/download/players/players.csv'
+    etag_path = output_path + '.etag'
+    sha256_path = output_path + '.sha256'
+
+    headers = {}
+    if exists and os.path.exists(etag_path) and os.path.exists(sha256_path):
+        with open(sha256_path, 'r', encoding='utf-8') as f:
+            expected_sha256 = f.read().strip()
+        if _file_sha256(output_path) == expected_sha256:
+            with open(etag_path, 'r', encoding='utf-8') as f:
+                headers['If-None-Match'] = f.read().strip()
+        else:
+            print(f"Players database at {output_path} was modified locally, downloading a fresh copy")
+
     print(f"Downloading players database from {url}...")
 
+    # Stream into a temporary file so a failed download never replaces a good copy
+    partial_path = output_path + '.part'
     try:
-        urllib.request.urlretrieve(url, output_path)
+        request = urllib.request.Request(url, headers=headers)
+        digest = hashlib.sha256()
+        with urllib.request.urlopen(request) as response, open(partial_path, 'wb') as f:
+            etag = response.headers.get('ETag')
+            while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                digest.update(chunk)
+        os.replace(partial_path, output_path)
+
+        with open(sha256_path, 'w', encoding='utf-8') as f:
+            f.write(digest.hexdigest())
+
+        # Remember the ETag so the next refresh can skip an unchanged file
+        if etag:
+            with open(etag_path, 'w', encoding='utf-8') as f:
+                f.write(etag)
+        elif os.path.exists(etag_path):
+            os.remove(etag_path)
+
         print(f"Players database downloaded to {output_path}")
         return output_path
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            print(f"Players database at {output_path} is up to date")
+            return output_path
+        print(f"Error downloading players database: {e}")
     except Exception as e:
         print(f"Error downloading players database: {e}")
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+    # Keep using the existing copy if a refresh failed
+    return output_path if exists else None
+
+def _load_database_cache(cache_path, signature):
+    """Return the pickled lookup dictionaries if they were built from the same CSV, else None."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = pickle.load(f)
+    except Exception:
+        # A missing, truncated or foreign cache is just a miss; the CSV is parsed again
+        return None
+
+    if not isinstance(cache, dict):
+        return None
+    if cache.get('version') != DATABASE_CACHE_VERSION or cache.get('signature') != signature:
         return None
+    return cache['databases']
+
+def _save_database_cache(cache_path, signature, databases):
+    """Pickle the lookup dictionaries so later runs can skip parsing the CSV."""
+    cache = {'version': DATABASE_CACHE_VERSION, 'signature': signature, 'databases': databases}
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"Could not write players database cache: {e}")
 
 def load_players_database(db_path='players.csv'):
-    """Load the players database and create lookup dictionaries."""
+    """Load the players database and create lookup dictionaries.
+
+    Besides the exact (name, team) lookups, two per-team indexes are built so
+    the fallback strategies in match_player_to_database are dict hits instead
+    of scans over the whole database:
+      nospace_db:  team -> {name with spaces removed: [player_data]}
+      lastname_db: team -> {last name: [player_data]}
+
+    The built dictionaries are pickled next to the CSV and reused while the
+    CSV's modification time and size are unchanged.
+    """
     players_db = {}
     short_name_db = {}  # Separate lookup for short_name (preferred)
+    nospace_db = {}
+    lastname_db = {}
 
     if not os.path.exists(db_path):
         print(f"Players database not found at {db_path}")
-        return players_db, short_name_db
+        return short_name_db, players_db, nospace_db, lastname_db
+
+    cache_path = os.path.splitext(db_path)[0] + '.pkl'
+    signature = (os.path.getmtime(db_path), os.path.getsize(db_path))
+    cached = _load_database_cache(cache_path, signature)
+    if cached is not None:
+        short_name_db, players_db = cached[0], cached[1]
+        print(f"Loaded {len(short_name_db)} short_name entries, {len(players_db)} other name variants (cached)")
+        return cached
 
     try:
         with open(db_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            # Plain csv.reader with column indices from the header avoids building a
+            # dict of every column for each of the ~20k rows
+            reader = csv.reader(f)
+            header = next(reader)
+            col = {name: i for i, name in enumerate(header)}
+            missing = [name for name in REQUIRED_DB_COLUMNS if name not in col]
+            if missing:
+                print(f"Players database is missing required columns: {', '.join(missing)}")
+                return short_name_db, players_db, nospace_db, lastname_db
+            gsis_col = col['gsis_id']
+            team_col = col['latest_team']
+            # Optional columns read as '' when absent, as if every row left them blank
+            status_col = col.get('status')
+            ngs_status_col = col.get('ngs_status')
+            display_name_col = col.get('display_name')
+            short_name_col = col.get('short_name')
+            football_name_col = col.get('football_name')
+            first_name_col = col.get('first_name')
+            last_name_col = col.get('last_name')
+            position_col = col.get('position')
+
             for row in reader:
-                gsis_id = row.get('gsis_id', '')
+                gsis_id = row[gsis_col]
                 if not gsis_id:
                     continue
 
                 # Only consider active players or developmental players (where both status and ngs_status are DEV)
-                status = row.get('status', '')
-                ngs_status = row.get('ngs_status', '')
+                status = row[status_col] if status_col is not None else ''
+                ngs_status = row[ngs_status_col] if ngs_status_col is not None else ''
                 if not (status == 'ACT' or (status == 'DEV' and ngs_status == 'DEV')):
                     continue
 
                 # Get all name variants
-                display_name = row.get('display_name', '')
-                short_name = row.get('short_name', '')
-                football_name = row.get('football_name', '')
-                first_name = row.get('first_name', '')
-                last_name = row.get('last_name', '')
-                team = row.get('latest_team', '')
-                position = row.get('position', '')
+                display_name = row[display_name_col] if display_name_col is not None else ''
+                short_name = row[short_name_col] if short_name_col is not None else ''
+                football_name = row[football_name_col] if football_name_col is not None else ''
+                first_name = row[first_name_col] if first_name_col is not None else ''
+                last_name = row[last_name_col] if last_name_col is not None else ''
+                # Teams and positions take only a few dozen distinct values; interning stores
+                # one string per value instead of one per row (pickle keeps the sharing)
+                team = sys.intern(row[team_col])
+                position = sys.intern(row[position_col] if position_col is not None else '')
 
                 player_data = {
                     'gsis_id': gsis_id,
@@ -147,12 +359,17 @@ def load_players_database(db_path='players.csv'):
                     'position': position
                 }
 
+                team_upper = sys.intern(team.upper())
+                team_nospace = nospace_db.setdefault(team_upper, {})
+
                 # Store short_name in separate database (preferred)
                 if short_name:
-                    key = (short_name.lower().strip(), team.upper())
+                    name_lower = short_name.lower().strip()
+                    key = (name_lower, team_upper)
                     if key not in short_name_db:
                         short_name_db[key] = []
                     short_name_db[key].append(player_data)
+                    team_nospace.setdefault(name_lower.replace(' ', ''), []).append(player_data)
 
                 # Store other name variants in main database
                 name_variants = []
@@ -172,58 +389,58 @@ def load_players_database(db_path='players.csv'):
                 # Store all variants - use list to handle multiple players with same name
                 for name in name_variants:
                     if name:
-                        key = (name.lower().strip(), team.upper())
+                        name_lower = name.lower().strip()
+                        key = (name_lower, team_upper)
                         if key not in players_db:
                             players_db[key] = []
                         players_db[key].append(player_data)
+                        team_nospace.setdefault(name_lower.replace(' ', ''), []).append(player_data)
+
+                # Index by last name for the partial match fallback
+                if last_name:
+                    last_name_lower = last_name.lower().strip()
+                    lastname_db.setdefault(team_upper, {}).setdefault(last_name_lower, []).append(player_data)
 
         print(f"Loaded {len(short_name_db)} short_name entries, {len(players_db)} other name variants")
-        return short_name_db, players_db
+        databases = (short_name_db, players_db, nospace_db, lastname_db)
+        _save_database_cache(cache_path, signature, databases)
+        return databases
     except Exception as e:
         print(f"Error loading players database: {e}")
-        return {}, {}
+        return {}, {}, {}, {}
 
 def get_team_abbr(team_name):
     """Convert full team name to abbreviation."""
-    team_mapping = {
-        'Houston Texans': 'HOU',
-        'Seattle Seahawks': 'SEA',
-        'Arizona Cardinals': 'ARI',
-        'Atlanta Falcons': 'ATL',
-        'Baltimore Ravens': 'BAL',
-        'Buffalo Bills': 'BUF',
-        'Carolina Panthers': 'CAR',
-        'Chicago Bears': 'CHI',
-        'Cincinnati Bengals': 'CIN',
-        'Cleveland Browns': 'CLE',
-        'Dallas Cowboys': 'DAL',
-        'Denver Broncos': 'DEN',
-        'Detroit Lions': 'DET',
-        'Green Bay Packers': 'GB',
-        'Indianapolis Colts': 'IND',
-        'Jacksonville Jaguars': 'JAX',
-        'Kansas City Chiefs': 'KC',
-        'Las Vegas Raiders': 'LV',
-        'Los Angeles Chargers': 'LAC',
-        'Los Angeles Rams': 'LAR',
-        'Miami Dolphins': 'MIA',
-        'Minnesota Vikings': 'MIN',
-        'New England Patriots': 'NE',
-        'New Orleans Saints': 'NO',
-        'New York Giants': 'NYG',
-        'New York Jets': 'NYJ',
-        'Philadelphia Eagles': 'PHI',
-        'Pittsburgh Steelers': 'PIT',
-        'San Francisco 49ers': 'SF',
-        'Tampa Bay Buccaneers': 'TB',
-        'Tennessee Titans': 'TEN',
-        'Washington Commanders': 'WAS'
-    }
-    return team_mapping.get(team_name, '')
-
-def match_player_to_database(player_name, team_name, position, short_name_db, players_db):
+    return TEAM_ABBR.get(team_name, '')
+
+def _pick_candidate(player_list, position):
+    """Return the candidate whose position matches, else the first one, and whether the position matched."""
+    for player_data in player_list:
+        if player_data.get('position', '') == position:
+            return player_data, True
+    return player_list[0], False
+
+def _close_lastname_candidates(team_lastnames, last_name):
+    """Yield player lists whose last name ends with last_name.
+
+    Names whose length differs by more than MAX_NAME_LENGTH_DIFF are skipped
+    before any string comparison, so most of the team is never compared.
+    """
+    if not last_name:
+        return
+    query_len = len(last_name)
+    for cand_last, player_list in team_lastnames.items():
+        if abs(len(cand_last) - query_len) > MAX_NAME_LENGTH_DIFF:
+            continue
+        if cand_last.endswith(last_name):
+            yield player_list
+
+def _first_initial(player_data):
+    """Return the lowercased first initial of a database player, e.g. 'n' for N.Collins."""
+    return (player_data['short_name'] or player_data['display_name'])[:1].lower()
+
+def match_player_to_database(player_name, team_abbr, position, short_name_db, players_db, nospace_db, lastname_db):
     """Match a player to the database and return their GSIS ID and match strategy."""
-    team_abbr = get_team_abbr(team_name)
     player_name_lower = player_name.lower().strip()
 
     # Strategy 1: Try short_name first (preferred)
@@ -256,103 +473,153 @@ def match_player_to_database(player_name, team_name, position, short_name_db, pl
     if candidate:
         return candidate, 'other_name_team'
 
-    # Strategy 4: Try with spaces removed in short_name (e.g., "N.Collins" vs "N. Collins")
+    # Strategy 4: Try with spaces removed (e.g., "A.St.Brown" vs "A.St. Brown")
     player_name_no_space = player_name_lower.replace(' ', '')
-    for (name, team), player_list in short_name_db.items():
-        if name.replace(' ', '') == player_name_no_space and team == team_abbr and player_list:
-            # Check position first
-            for player_data in player_list:
-                db_position = player_data.get('position', '')
-                if db_position == position:
-                    return player_data['gsis_id'], 'short_name_no_spaces_position'
-            # Return first match if position doesn't match
-            return player_list[0]['gsis_id'], 'short_name_no_spaces'
-
-    # Strategy 5: Try with spaces removed in other names
-    for (name, team), player_list in players_db.items():
-        if name.replace(' ', '') == player_name_no_space and team == team_abbr and player_list:
-            # Check position first
-            for player_data in player_list:
-                db_position = player_data.get('position', '')
-                if db_position == position:
-                    return player_data['gsis_id'], 'other_name_no_spaces_position'
-            # Return first match if position doesn't match
-            return player_list[0]['gsis_id'], 'other_name_no_spaces'
-
-    # Strategy 6: Try partial match on last name only (as last resort, still requires team)
+    player_list = nospace_db.get(team_abbr, {}).get(player_name_no_space)
+    if player_list:
+        player_data, position_match = _pick_candidate(player_list, position)
+        return player_data['gsis_id'], 'no_spaces_position' if position_match else 'no_spaces'
+
+    # Strategy 5: Try a match on last name only (as last resort, still requires team)
     if '.' in player_name:
         last_name = player_name.split('.')[-1].lower().strip()
-        # Check short_name first
-        for (name, team), player_list in short_name_db.items():
-            if team == team_abbr and name.endswith(last_name) and player_list:
-                # Check position first
-                for player_data in player_list:
-                    db_position = player_data.get('position', '')
-                    if db_position == position:
-                        return player_data['gsis_id'], 'short_name_partial_lastname_position'
-                # Return first match if position doesn't match
-                return player_list[0]['gsis_id'], 'short_name_partial_lastname'
-        # Then check other names
-        for (name, team), player_list in players_db.items():
-            if team == team_abbr and name.endswith(last_name) and player_list:
-                # Check position first
-                for player_data in player_list:
-                    db_position = player_data.get('position', '')
-                    if db_position == position:
-                        return player_data['gsis_id'], 'other_name_partial_lastname_position'
-                # Return first match if position doesn't match
-                return player_list[0]['gsis_id'], 'other_name_partial_lastname'
+        team_lastnames = lastname_db.get(team_abbr, {})
+        player_list = team_lastnames.get(last_name)
+        if player_list:
+            player_data, position_match = _pick_candidate(player_list, position)
+            return player_data['gsis_id'], 'lastname_position' if position_match else 'lastname'
+
+        # Strategy 6: Partial last name match (e.g., "Brien" vs "O'Brien") among close-length names only
+        for player_list in _close_lastname_candidates(team_lastnames, last_name):
+            player_data, position_match = _pick_candidate(player_list, position)
+            return player_data['gsis_id'], 'partial_lastname_position' if position_match else 'partial_lastname'
+
+        # Strategy 7: Fuzzy match on the last name only, among teammates with the same first
+        # initial (requires rapidfuzz). Scoring the whole name let the shared initial carry
+        # different players such as J.Smith and J.Smyth over the cutoff.
+        if process is not None and last_name:
+            initial = player_name_lower[:1]
+            query_len = len(last_name)
+            choices = {}
+            for cand_last, player_list in team_lastnames.items():
+                if abs(len(cand_last) - query_len) > MAX_NAME_LENGTH_DIFF:
+                    continue
+                same_initial = [p for p in player_list if _first_initial(p) == initial]
+                if same_initial:
+                    choices[cand_last] = same_initial
+            match = process.extractOne(last_name, list(choices), scorer=fuzz.WRatio, score_cutoff=FUZZY_SCORE_CUTOFF)
+            if match:
+                player_data, position_match = _pick_candidate(choices[match[0]], position)
+                return player_data['gsis_id'], 'fuzzy_position' if position_match else 'fuzzy'
 
     return None, None
 
-def extract_game_date(lines):
-    """Extract the game date from the PDF."""
-    for line in lines:
-        # Look for date line like "Date: Monday, 10/20/2025"
-        if line.startswith('Date:'):
-            parts = line.split()
-            # Date should be in format MM/DD/YYYY
-            for part in parts:
-                if '/' in part:
-                    date_parts = part.split('/')
-                    if len(date_parts) == 3:
-                        try:
-                            month, day, year = date_parts
-                            return int(year)
-                        except ValueError:
-                            continue
+def make_player_matcher(short_name_db, players_db, nospace_db, lastname_db, maxsize=20000):
+    """Return a memoized match(player_name, team_abbr, position) bound to the loaded database.
+
+    The database does not change during a run, so a player who appears in
+    several gamebooks of a batch is only matched once.
+    """
+    @lru_cache(maxsize=maxsize)
+    def match(player_name, team_abbr, position):
+        return match_player_to_database(player_name, team_abbr, position, short_name_db, players_db, nospace_db, lastname_db)
+    return match
+
+def _parse_date_year(line):
+    """Return the year from a date line like "Date: Monday, 10/20/2025", or None."""
+    parts = line.split()
+    # Date should be in format MM/DD/YYYY
+    for part in parts:
+        if '/' in part:
+            date_parts = part.split('/')
+            if len(date_parts) == 3:
+                try:
+                    month, day, year = date_parts
+                    return int(year)
+                except ValueError:
+                    continue
     return None
 
-def extract_game_score(lines):
-    """Extract the final game score from the PDF."""
-    visitor_score = None
-    home_score = None
-    visitor_team = None
-    home_team = None
-
-    for line in lines:
-        # Look for lines like "VISITOR: Houston Texans 0 6 6 7 0 19"
-        if line.startswith('VISITOR:'):
-            parts = line.split()
-            # Team name is after VISITOR: and before the numbers
-            # Numbers are at the end, last one is total
-            if len(parts) >= 3:
-                # Find where numbers start
-                for i, part in enumerate(parts):
-                    if part.isdigit():
-                        visitor_team = ' '.join(parts[1:i])
-                        visitor_score = parts[-1]  # Last number is total
-                        break
-        elif line.startswith('HOME:'):
-            parts = line.split()
-            if len(parts) >= 3:
-                for i, part in enumerate(parts):
-                    if part.isdigit():
-                        home_team = ' '.join(parts[1:i])
-                        home_score = parts[-1]  # Last number is total
-                        break
+def _parse_team_score(line):
+    """Return (team, total score) from a line like "VISITOR: Houston Texans 0 6 6 7 0 19"."""
+    parts = line.split()
+    # Team name is after VISITOR:/HOME: and before the numbers
+    # Numbers are at the end, last one is total
+    if len(parts) >= 3:
+        # Find where numbers start
+        for i, part in enumerate(parts):
+            if part.isdigit():
+                return ' '.join(parts[1:i]), parts[-1]
+    return None, None
 
-    return visitor_team, visitor_score, home_team, home_score
+def scan_first_page(lines):
+    """Extract the header fields and section positions of page one in a single pass.
+
+    Returns a dict with season, visitor_team, visitor_score, home_team and
+    home_score, plus the line index of each section header: lineups_idx,
+    substitutions_idx, did_not_play_idx and not_active_idx. Missing values are None.
+    """
+    fields = dict.fromkeys((
+        'season', 'visitor_team', 'visitor_score', 'home_team', 'home_score',
+        'lineups_idx', 'substitutions_idx', 'did_not_play_idx', 'not_active_idx',
+    ))
+
+    for i, line in enumerate(lines):
+        m = PAGE_MARKER_RE.search(line)
+        if not m:
+            continue
+        marker = m.group().strip()
+
+        if marker == 'Date:':
+            if fields['season'] is None:
+                fields['season'] = _parse_date_year(line)
+        elif marker == 'VISITOR:':
+            team, score = _parse_team_score(line)
+            if team is not None:
+                fields['visitor_team'], fields['visitor_score'] = team, score
+        elif marker == 'HOME:':
+            team, score = _parse_team_score(line)
+            if team is not None:
+                fields['home_team'], fields['home_score'] = team, score
+        elif marker == 'Lineups':
+            fields['lineups_idx'] = i
+        else:
+            # Keep the first line of each remaining section
+            key = SECTION_INDEX_KEYS[marker]
+            if fields[key] is None:
+                fields[key] = i
+
+    return fields
+
+@contextmanager
+def _time_limit(seconds):
+    """Raise TimeoutError if the block runs longer than seconds.
+
+    Uses SIGALRM, so it only takes effect on POSIX in the main thread.
+    """
+    if not hasattr(signal, 'SIGALRM') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def on_timeout(signum, frame):
+        raise TimeoutError(f"page processing took longer than {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, on_timeout)
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+
+def _parse_section_halves(page, top, bottom, header, visitor_team, home_team, status):
+    """Parse a two-column player list section, visitor on the left half and home on the right."""
+    half_width = page.width / 2
+    players = []
+    for x0, x1, team in ((0, half_width, visitor_team), (half_width, page.width, home_team)):
+        section_text = page.within_bbox((x0, top, x1, bottom)).extract_text()
+        players.extend(parse_player_list(section_text.replace(header, '').strip(), team, status))
+    return players
 
 def extract_players_from_pdf(pdf_path):
     """Main function to extract all player data from the PDF."""
@@ -361,40 +628,36 @@ def extract_players_from_pdf(pdf_path):
     season = None
     teams = {}
 
-    with pdfplumber.open(pdf_path) as pdf:
+    # The time limit covers the whole page, including the cropped extract_text() calls
+    # for each section, so a pathological PDF cannot stall a worker
+    with pdfplumber.open(pdf_path) as pdf, ExitStack() as cleanup, _time_limit(PAGE_TIMEOUT):
         first_page = pdf.pages[0]
-        page_width = first_page.width
-        page_height = first_page.height
-
-        text = first_page.extract_text()
+        # Release the page's parsed chars/words when done; the page and the PDF reference
+        # each other, so otherwise they linger until the cyclic GC runs
+        cleanup.callback(first_page.flush_cache)
+
+        # Text and word extraction are the expensive steps, so do each once per page.
+        # extract_text_simple() groups characters into lines without the word
+        # layout pass that extract_text() runs.
+        text = first_page.extract_text_simple()
+        words = first_page.extract_words()
         lines = text.split('\n')
 
-        # Extract game date/season
-        season = extract_game_date(lines)
-
-        # Extract game score and team info
-        visitor_team, visitor_score, home_team, home_score = extract_game_score(lines)
+        # Extract game date/season, score, team info and section positions
+        fields = scan_first_page(lines)
+        season = fields['season']
+        visitor_team = fields['visitor_team']
+        home_team = fields['home_team']
         if visitor_team and home_team:
-            game_score = f"{visitor_team} {visitor_score}, {home_team} {home_score}"
+            game_score = f"{visitor_team} {fields['visitor_score']}, {home_team} {fields['home_score']}"
             # Store team matchup for opponent lookup
             teams['visitor'] = visitor_team
             teams['home'] = home_team
 
-        # Find key line indices
-        lineups_idx = None
-        substitutions_idx = None
-        did_not_play_idx = None
-        not_active_idx = None
-
-        for i, line in enumerate(lines):
-            if line.strip() == 'Lineups':
-                lineups_idx = i
-            elif 'Substitutions' in line and substitutions_idx is None:
-                substitutions_idx = i
-            elif 'Did Not Play' in line and did_not_play_idx is None:
-                did_not_play_idx = i
-            elif 'Not Active' in line and not_active_idx is None:
-                not_active_idx = i
+        lineups_idx = fields['lineups_idx']
+        substitutions_idx = fields['substitutions_idx']
+        did_not_play_idx = fields['did_not_play_idx']
+        not_active_idx = fields['not_active_idx']
 
         # Parse starters (lines between Lineups and Substitutions)
         if lineups_idx and substitutions_idx:
@@ -412,105 +675,84 @@ def extract_players_from_pdf(pdf_path):
             # Get y-coordinates for substitutions section
             sub_start_y = None
             sub_end_y = None
-            words = first_page.extract_words()
             for word in words:
                 if word['text'] == 'Substitutions':
                     sub_start_y = word['top']
-                if 'Did' in word['text'] and 'Not' in first_page.extract_text()[first_page.extract_text().find(word['text']):first_page.extract_text().find(word['text'])+20]:
-                    sub_end_y = word['top']
-                    break
+                if 'Did' in word['text']:
+                    # Look for "Not" within 20 characters of where the word appears in the page text
+                    pos = text.find(word['text'])
+                    if text.find('Not', pos, pos + 20) != -1:
+                        sub_end_y = word['top']
+                        break
 
             if sub_start_y and sub_end_y:
-                # Extract left half (visitor) and right half (home)
-                bbox_left = (0, sub_start_y, page_width/2, sub_end_y)
-                bbox_right = (page_width/2, sub_start_y, page_width, sub_end_y)
-
-                visitor_text = first_page.within_bbox(bbox_left).extract_text()
-                home_text = first_page.within_bbox(bbox_right).extract_text()
-
-                # Remove the "Substitutions" header
-                visitor_text = visitor_text.replace('Substitutions', '').strip()
-                home_text = home_text.replace('Substitutions', '').strip()
-
-                visitor_players = parse_player_list(visitor_text, visitor_team, 'backup')
-                home_players = parse_player_list(home_text, home_team, 'backup')
-
-                all_players.extend(visitor_players)
-                all_players.extend(home_players)
+                all_players.extend(_parse_section_halves(
+                    first_page, sub_start_y, sub_end_y, 'Substitutions', visitor_team, home_team, 'backup'))
 
         # Parse "Did Not Play" section - use bbox to split left/right halves
         if did_not_play_idx and not_active_idx:
             # Get y-coordinates for DNP section
             dnp_start_y = None
             dnp_end_y = None
-            words = first_page.extract_words()
-            for word in words:
+            for idx, word in enumerate(words):
                 if word['text'] == 'Did' and dnp_start_y is None:
                     # Check if this is "Did Not Play"
-                    idx = words.index(word)
                     if idx + 2 < len(words) and words[idx+1]['text'] == 'Not' and words[idx+2]['text'] == 'Play':
                         dnp_start_y = word['top']
-                if word['text'] == 'Not' and 'Active' in [w['text'] for w in words[words.index(word):words.index(word)+3]]:
+                if word['text'] == 'Not' and 'Active' in [w['text'] for w in words[idx:idx+3]]:
                     dnp_end_y = word['top']
                     break
 
             if dnp_start_y and dnp_end_y:
-                # Extract left half (visitor) and right half (home)
-                bbox_left = (0, dnp_start_y, page_width/2, dnp_end_y)
-                bbox_right = (page_width/2, dnp_start_y, page_width, dnp_end_y)
-
-                visitor_text = first_page.within_bbox(bbox_left).extract_text()
-                home_text = first_page.within_bbox(bbox_right).extract_text()
-
-                # Remove headers
-                visitor_text = visitor_text.replace('Did Not Play', '').strip()
-                home_text = home_text.replace('Did Not Play', '').strip()
-
-                visitor_players = parse_player_list(visitor_text, visitor_team, 'did_not_play')
-                home_players = parse_player_list(home_text, home_team, 'did_not_play')
-
-                all_players.extend(visitor_players)
-                all_players.extend(home_players)
+                all_players.extend(_parse_section_halves(
+                    first_page, dnp_start_y, dnp_end_y, 'Did Not Play', visitor_team, home_team, 'did_not_play'))
 
         # Parse inactive players - use bbox to split left/right halves
         if not_active_idx:
             # Get y-coordinates for Not Active section
             na_start_y = None
             na_end_y = None
-            words = first_page.extract_words()
-            for word in words:
+            for idx, word in enumerate(words):
                 if word['text'] == 'Not' and na_start_y is None:
                     # Check if this is "Not Active"
-                    idx = words.index(word)
                     if idx + 1 < len(words) and words[idx+1]['text'] == 'Active':
                         na_start_y = word['top']
                 if word['text'] == 'Field' and na_start_y is not None:
                     # Check if this is "Field Goals"
-                    idx = words.index(word)
                     if idx + 1 < len(words) and words[idx+1]['text'] == 'Goals':
                         na_end_y = word['top']
                         break
 
             if na_start_y and na_end_y:
-                # Extract left half (visitor) and right half (home)
-                bbox_left = (0, na_start_y, page_width/2, na_end_y)
-                bbox_right = (page_width/2, na_start_y, page_width, na_end_y)
-
-                visitor_text = first_page.within_bbox(bbox_left).extract_text()
-                home_text = first_page.within_bbox(bbox_right).extract_text()
-
-                # Remove headers
-                visitor_text = visitor_text.replace('Not Active', '').strip()
-                home_text = home_text.replace('Not Active', '').strip()
-
-                visitor_players = parse_player_list(visitor_text, visitor_team, 'inactive')
-                home_players = parse_player_list(home_text, home_team, 'inactive')
-
-                all_players.extend(visitor_players)
-                all_players.extend(home_players)
+                all_players.extend(_parse_section_halves(
+                    first_page, na_start_y, na_end_y, 'Not Active', visitor_team, home_team, 'inactive'))
 
     return all_players, game_score, season, teams
 
+def _extract_pdf_safely(pdf_path):
+    """Run extract_players_from_pdf, returning (result, error) so one bad PDF doesn't stop a batch."""
+    try:
+        return extract_players_from_pdf(pdf_path), None
+    except TimeoutError as e:
+        return None, str(e)
+
+def extract_all_pdfs(pdf_paths, jobs=None):
+    """Yield (pdf_path, result, error) for each PDF in order.
+
+    PDF parsing dominates the run time and each file is independent, so with
+    more than one file the extraction is spread over worker processes (jobs
+    of them, or one per CPU when jobs is None).
+    """
+    if jobs == 1 or len(pdf_paths) < 2:
+        for pdf_path in pdf_paths:
+            result, error = _extract_pdf_safely(pdf_path)
+            yield pdf_path, result, error
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for pdf_path, (result, error) in zip(pdf_paths, executor.map(_extract_pdf_safely, pdf_paths)):
+            yield pdf_path, result, error
+
 def get_opponent(team, teams):
     """Get the opponent for a given team."""
     if team == teams.get('visitor'):
@@ -551,34 +793,35 @@ def save_to_sql(players, output_path, week, season, teams, game_score=None):
             sqlfile.write(f"exec pickem.set_nfl_score( {season}, {week}, {visitor_score}, '{visitor_team}', {home_score}, '{home_team}' );\n")
             sqlfile.write("\n")
 
-        # Write SQL statements
+        # Only two teams play in a game, so resolve each one's opponent once
+        opponents = {team: get_opponent(team, teams) for team in (teams.get('visitor'), teams.get('home'))}
+
+        # Build all SQL statements and write them in one call
+        out = []
+        append = out.append
         for player in players:
-            gsis_id = player.get('gsis_id', '')
-            team = player.get('team', '')
-            opponent = get_opponent(team, teams)
-            position = player.get('position', '')
-            status_full = player.get('status', '')
-            name = player.get('name', '')
+            gsis_id = player.gsis_id
+            team = player.team
+            opponent = opponents.get(team, '')
+            position = player.position
+            status_full = player.status
+            name = player.name
 
             # Convert status to single uppercase character
-            status_map = {
-                'starter': 'S',
-                'backup': 'B',
-                'inactive': 'I',
-                'did_not_play': 'B'
-            }
-            status = status_map.get(status_full, status_full[0].upper() if status_full else '')
+            status = STATUS_CODE.get(status_full) or status_full[:1].upper()
 
             # Generate SQL statement
             sql = f"exec stats.find_or_create_rawstat_gsis('{gsis_id}', '{team}', '{opponent}', {week}, {season}, '{position}', '{status}');"
 
             # Check if GSIS ID is valid (standard format: 00-XXXXXXX or old format like RIV553722)
-            if gsis_id and (gsis_id.startswith('00-') or (len(gsis_id) >= 8 and gsis_id[:3].isalpha() and gsis_id[3:].isdigit())):
+            if VALID_GSIS_RE.match(gsis_id):
                 # Valid GSIS ID - write normally
-                sqlfile.write(sql + "\n")
+                append(sql + "\n")
             else:
                 # Invalid or missing GSIS ID - comment it out
-                sqlfile.write(f"-- INVALID GSIS: {name} ({team}) - {sql}\n")
+                append(f"-- INVALID GSIS: {name} ({team}) - {sql}\n")
+
+        sqlfile.writelines(out)
 
 def save_to_csv(players, output_path, game_score=None):
     """Save player data to CSV file."""
@@ -587,21 +830,29 @@ def save_to_csv(players, output_path, game_score=None):
         if game_score:
             csvfile.write(f"# {game_score}\n")
 
-        fieldnames = ['gsis_id', 'team', 'name', 'position', 'status']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.writer(csvfile)
 
-        writer.writeheader()
-        for player in players:
-            writer.writerow(player)
+        writer.writerow(CSV_FIELDS)
+        # attrgetter builds each row tuple in C instead of a Python-level expression per player
+        writer.writerows(map(attrgetter(*CSV_FIELDS), players))
 
 if __name__ == '__main__':
     import argparse
 
+    def positive_int(value):
+        """argparse type for counts that must be at least 1."""
+        number = int(value)
+        if number < 1:
+            raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+        return number
+
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Extract player data from NFL gamebook PDF and generate SQL statements')
     parser.add_argument('pdf_file', nargs='?', default='housea.pdf', help='PDF file to process')
     parser.add_argument('--week', '-w', type=int, required=True, help='Week number')
     parser.add_argument('--season', '-s', type=int, help='Season year (defaults to year from PDF)')
+    parser.add_argument('--refresh-db', action='store_true', help='Re-download the players database if it has changed')
+    parser.add_argument('--jobs', '-j', type=positive_int, help='Number of PDFs to parse in parallel (defaults to the CPU count)')
     args = parser.parse_args()
 
     pdf_pattern = args.pdf_file
@@ -616,16 +867,20 @@ if __name__ == '__main__':
 
     # Download and load players database once (outside the loop)
     db_path = 'players.csv'
-    download_players_database(db_path)
-    short_name_db, players_db = load_players_database(db_path)
+    download_players_database(db_path, refresh=args.refresh_db)
+    short_name_db, players_db, nospace_db, lastname_db = load_players_database(db_path)
+    match_player = make_player_matcher(short_name_db, players_db, nospace_db, lastname_db)
     print()  # Blank line after database loading
 
     # Process each PDF file
-    for file_idx, pdf_path in enumerate(pdf_files, 1):
+    for file_idx, (pdf_path, result, error) in enumerate(extract_all_pdfs(pdf_files, args.jobs), 1):
         # Generate output filename from input filename (change to .sql)
         output_path = os.path.splitext(pdf_path)[0] + '.sql'
 
-        players, game_score, season, teams = extract_players_from_pdf(pdf_path)
+        if error:
+            print(f"ERROR: {pdf_path} - {error}")
+            continue
+        players, game_score, season, teams = result
 
         # Use season from command line if provided, otherwise use from PDF
         if args.season:
@@ -637,16 +892,24 @@ if __name__ == '__main__':
         # Match players to database and add GSIS IDs
         matched_count = 0
         unmatched_players = []
+        fuzzy_players = []
+
+        # Only two teams play in a game, so resolve their abbreviations once per PDF.
+        # Taken from the players themselves, since teams is empty when a header line fails to parse.
+        team_abbrs = {team: get_team_abbr(team) for team in {player.team for player in players}}
 
         for player in players:
-            gsis_id, strategy = match_player_to_database(player['name'], player['team'], player['position'], short_name_db, players_db)
-            player['gsis_id'] = gsis_id if gsis_id else ''
-            player['match_strategy'] = strategy
+            gsis_id, strategy = match_player(player.name, team_abbrs[player.team], player.position)
+            player.gsis_id = gsis_id if gsis_id else ''
+            player.match_strategy = strategy
 
             if gsis_id:
                 matched_count += 1
+                # Fuzzy matches may be a different player, so list them for review
+                if strategy.startswith('fuzzy'):
+                    fuzzy_players.append(f"{player.name} -> {gsis_id} ({player.team} {player.position})")
             else:
-                unmatched_players.append(f"{player['name']} ({player['team']} {player['position']})")
+                unmatched_players.append(f"{player.name} ({player.team} {player.position})")
 
         # Save all players (function will comment out invalid ones)
         save_to_sql(players, output_path, week, season, teams, game_score)
@@ -657,6 +920,9 @@ if __name__ == '__main__':
         match_pct = (matched_count * 100) // len(players) if len(players) > 0 else 0
         print(f"{visitor_team} @ {home_team}: {len(players)} players, {match_pct}% matched -> {output_path}")
 
+        for name in fuzzy_players:
+            print(f"  FUZZY: {name}")
+
         # Show unmatched players if any
         if unmatched_players:
             for name in unmatched_players: